@@ -25,8 +25,9 @@ export default {
     // Cloudflare Workers Scheduled Event Handler
     const icsUrl = env.ICS_URL;
     const logLevel = env.LOG_LEVEL || 'INFO';
+    const now = new Date().toISOString();
     
-    console.log(`[${new Date().toISOString()}] Scheduled task triggered`);
+    console.log(`[${now}] Scheduled task triggered`);
     
     if (!icsUrl) {
       console.error('ICS_URL environment variable not set');
@@ -48,7 +49,7 @@ export default {
       // Option 2: Store results in KV or R2
       if (env.WORKOUTS_KV) {
         await env.WORKOUTS_KV.put(
-          `workouts-${new Date().toISOString().split('T')[0]}`,
+          `workouts-${now.split('T')[0]}`,
           JSON.stringify(result.workouts)
         );
       }
@@ -99,7 +100,7 @@ export default {
 # Alternative: Use Cloudflare Pages Functions with Python
 # Create functions/convert.py:
 """
-import json
+import orjson
 from runna_to_intervals import RunnaWorkoutConverter, StructuredLogger
 
 async def on_request(context):
@@ -114,8 +115,9 @@ async def on_request(context):
         converter = RunnaWorkoutConverter(ics_url, logger=logger)
         workouts = converter.process_calendar()
         
+        # orjson returns bytes, which Response accepts without re-encoding
         return Response(
-            json.dumps({
+            orjson.dumps({
                 'success': True,
                 'workouts': workouts,
                 'count': len(workouts)
@@ -125,7 +127,7 @@ async def on_request(context):
     except Exception as e:
         logger.error('Conversion failed', error=str(e))
         return Response(
-            json.dumps({'success': False, 'error': str(e)}),
+            orjson.dumps({'success': False, 'error': str(e)}),
             status=500,
             headers={'Content-Type': 'application/json'}
         )
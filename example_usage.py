@@ -5,17 +5,55 @@ Demonstrates how to use the converter with sample workout descriptions
 """
 
 from runna_to_intervals import RunnaWorkoutConverter
-from datetime import datetime
-from icalendar import Calendar, Event
-import json
+from datetime import datetime, timezone
+import copy
+import sys
+
+try:
+    import orjson
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to JSON bytes using orjson"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    import json
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to JSON bytes using the stdlib json module"""
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+# Fixed-shape ICS records for the sample calendar
+ICS_HEADER = (
+    b"BEGIN:VCALENDAR\r\n"
+    b"PRODID:-//Runna Training Calendar//example.com//\r\n"
+    b"VERSION:2.0\r\n"
+)
+ICS_FOOTER = b"END:VCALENDAR\r\n"
+ICS_EVENT_TEMPLATE = (
+    b"BEGIN:VEVENT\r\n"
+    b"%s"
+    b"%s"
+    b"DTSTART:%s\r\n"
+    b"DTSTAMP:%s\r\n"
+    b"END:VEVENT\r\n"
+)
+ICS_DATETIME_FORMAT = '%Y%m%dT%H%M%S'
+
+
+def ics_text_line(name: str, value: str) -> bytes:
+    """Build an escaped, folded (75 octet) ICS TEXT content line"""
+    value = (value.replace('\\', '\\\\').replace(';', '\\;')
+             .replace(',', '\\,').replace('\n', '\\n'))
+    line = f"{name}:{value}".encode()
+    folded = [line[:75]]
+    for i in range(75, len(line), 74):
+        folded.append(b" " + line[i:i + 74])
+    return b"\r\n".join(folded) + b"\r\n"
 
 
 def create_sample_ics_file():
     """Create a sample ICS file for testing"""
-    cal = Calendar()
-    cal.add('prodid', '-//Runna Training Calendar//example.com//')
-    cal.add('version', '2.0')
-    
     # Sample workouts
     workouts = [
         {
@@ -45,22 +83,35 @@ def create_sample_ics_file():
         }
     ]
     
+    # DTSTAMP must be in UTC
+    now = datetime.now(timezone.utc).strftime(ICS_DATETIME_FORMAT + 'Z').encode()
+    chunks = [ICS_HEADER]
     for workout in workouts:
-        event = Event()
-        event.add('summary', workout['summary'])
-        event.add('description', workout['description'])
-        event.add('dtstart', workout['date'])
-        event.add('dtstamp', datetime.now())
-        cal.add_component(event)
+        chunks.append(ICS_EVENT_TEMPLATE % (
+            ics_text_line('SUMMARY', workout['summary']),
+            ics_text_line('DESCRIPTION', workout['description']),
+            workout['date'].strftime(ICS_DATETIME_FORMAT).encode(),
+            now
+        ))
+    chunks.append(ICS_FOOTER)
     
     # Save to file
     with open('/home/claude/sample_runna_calendar.ics', 'wb') as f:
-        f.write(cal.to_ical())
+        f.write(b''.join(chunks))
     
     print("Created sample ICS file: sample_runna_calendar.ics")
 
 
-def test_workout_parsing():
+INTERVAL_TEMPLATE = (
+    "  {j}. {iv.text}\n"
+    "     - Repeat: {iv.repeat}x\n"
+    "     - Duration: {iv.duration}s\n"
+    "     - Intensity: {iv.intensity}\n"
+    "     - Type: {iv.type}"
+)
+
+
+def test_workout_parsing(converter: RunnaWorkoutConverter):
     """Test workout parsing with sample descriptions"""
     print("\n=== Testing Workout Parsing ===\n")
     
@@ -68,8 +119,6 @@ def test_workout_parsing():
     create_sample_ics_file()
     
     # Test parsing individual workout descriptions
-    converter = RunnaWorkoutConverter('http://example.com/dummy.ics')
-    
     test_cases = [
         {
             'description': 'Warm up 10min easy, 5x(1km @ tempo, 2min recovery), Cool down 10min easy',
@@ -89,23 +138,23 @@ def test_workout_parsing():
         }
     ]
     
+    out = []
     for i, test in enumerate(test_cases, 1):
-        print(f"Test Case {i}: {test['summary']}")
-        print(f"Description: {test['description']}")
+        out.append(f"Test Case {i}: {test['summary']}")
+        out.append(f"Description: {test['description']}")
         
         intervals = converter.parse_workout_description(
             test['description'], 
             test['summary']
         )
         
-        print(f"Parsed {len(intervals)} intervals:")
-        for j, interval in enumerate(intervals, 1):
-            print(f"  {j}. {interval['text']}")
-            print(f"     - Repeat: {interval['repeat']}x")
-            print(f"     - Duration: {interval['duration']}s")
-            print(f"     - Intensity: {interval['intensity']}")
-            print(f"     - Type: {interval['type']}")
-        print()
+        out.append(f"Parsed {len(intervals)} intervals:")
+        out.extend(INTERVAL_TEMPLATE.format(j=j, iv=interval)
+                   for j, interval in enumerate(intervals, 1))
+        out.append("")
+    
+    # Single write instead of one print per line
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def example_convert_from_url():
@@ -121,12 +170,14 @@ def example_convert_from_url():
     print()
 
 
-def example_custom_intensity_mapping():
+def example_custom_intensity_mapping(converter: RunnaWorkoutConverter):
     """Example of customizing intensity mappings"""
     print("\n=== Example: Custom Intensity Mapping ===\n")
     
-    # Create custom converter
-    converter = RunnaWorkoutConverter('http://example.com/dummy.ics')
+    # Copy the converter with its own map so changes don't leak into
+    # the shared class-level INTENSITY_MAP
+    converter = copy.copy(converter)
+    converter.INTENSITY_MAP = dict(converter.INTENSITY_MAP)
     
     # Modify intensity map
     converter.INTENSITY_MAP['marathon pace'] = 3  # Change from 4 to 3
@@ -172,7 +223,7 @@ def example_intervals_icu_format():
     }
     
     print("Sample intervals.icu workout format:")
-    print(json.dumps(sample_workout, indent=2))
+    print(dumps(sample_workout, indent=True).decode())
     print()
     print("This can be imported into intervals.icu or used with their API")
 
@@ -183,10 +234,12 @@ def main():
     print("Runna to Intervals.icu Converter - Examples")
     print("=" * 60)
     
+    converter = RunnaWorkoutConverter('http://example.com/dummy.ics')
+    
     # Run examples
-    test_workout_parsing()
+    test_workout_parsing(converter)
     example_convert_from_url()
-    example_custom_intensity_mapping()
+    example_custom_intensity_mapping(converter)
     example_intervals_icu_format()
     
     print("\n" + "=" * 60)
@@ -12,15 +12,418 @@ Can be run from:
 """
 
 import requests
-from icalendar import Calendar
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import itertools
 import json
 import logging
 import sys
 import os
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import sqlite3
+import time
+from datetime import date, datetime, timezone
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple, TYPE_CHECKING
 from enum import Enum
+from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# icalendar is imported lazily (it is slow to import and process_calendar
+# usually doesn't need it), so it is only imported here for type hints
+if TYPE_CHECKING:
+    from icalendar import Calendar
+
+try:
+    import orjson
+
+    def _dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to JSON bytes using orjson"""
+        option = orjson.OPT_UTC_Z | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    def _json_default(obj):
+        """Encode datetimes the way orjson does (RFC 3339, UTC as Z)"""
+        if isinstance(obj, datetime):
+            return obj.isoformat().replace('+00:00', 'Z')
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def _dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to JSON bytes using the stdlib json module"""
+        return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode()
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+
+# Precompiled workout description patterns
+_INTERVAL_RE = re.compile(r'(\d+)\s*x\s*\(([^)]+)\)', re.IGNORECASE)
+_SPLIT_RE = re.compile(r',|and')
+_WARMUP_RE = re.compile(r'warm\s*up\s+(\d+(?:\s*min)?)', re.IGNORECASE)
+_COOLDOWN_RE = re.compile(r'cool\s*down\s+(\d+(?:\s*min)?)', re.IGNORECASE)
+# Single-pass classification of a lowercase interval part: a time unit,
+# anything distance-like ("m" or "k "), or a recovery keyword. "min" also
+# contains the "m" that flags a distance, so it sets both bits.
+_CLASSIFY_RE = re.compile(r'(?P<min>min)|(?P<time>hour)|(?P<rest>recovery|rest)|(?P<distance>m|k(?= ))')
+_TIME_BIT, _DISTANCE_BIT, _REST_BIT = 1, 2, 4
+_CLASSIFY_BITS = {'min': _TIME_BIT | _DISTANCE_BIT, 'time': _TIME_BIT,
+                  'distance': _DISTANCE_BIT, 'rest': _REST_BIT}
+# Single-pass tokenizer for "<number><unit>" quantities in lowercase text
+_QUANTITY_RE = re.compile(
+    r'(\d+(?:\.\d+)?)\s*(?:'
+    r'(?P<hours>h(?:ours?|rs?)?)|'
+    r'(?P<minutes>min(?:ute)?s?)|'
+    r'(?P<seconds>s(?:ec(?:ond)?)?s?)|'
+    r'(?P<km>k(?:ms?|ilomet(?:er|re)s?)?)|'
+    r'(?P<miles>mi(?:le)?s?)|'
+    r'(?P<meters>m(?:et(?:er|re)s?)?)'
+    r')(?![a-z])'
+)
+_SECONDS_PER_UNIT = {'hours': 3600, 'minutes': 60, 'seconds': 1}
+_METERS_PER_UNIT = {'km': 1000, 'miles': 1609.34, 'meters': 1}
+# Pattern: 4:50/km or 4:50 /km or 4:50/k
+_PACE_RE = re.compile(r'(\d+):(\d+)\s*/?k(?:m)?')
+
+# Raw ICS scanning patterns (applied to unfolded VEVENT blocks). Names are
+# case-insensitive, and quoted parameter values may contain ':' and ';'.
+_FOLD_RE = re.compile(rb'\r?\n[ \t]')
+_VEVENT_RE = re.compile(rb'^BEGIN:VEVENT\r?$(.*?)^END:VEVENT\r?$', re.MULTILINE | re.DOTALL | re.IGNORECASE)
+_SUBCOMPONENT_RE = re.compile(rb'^BEGIN:([A-Z-]+)\r?$.*?^END:\1\r?$', re.MULTILINE | re.DOTALL | re.IGNORECASE)
+_PROP_PARAMS = rb'(?:;(?:[^:;"\r\n]|"[^"\r\n]*")*)*'
+_SUMMARY_PROP_RE = re.compile(rb'^SUMMARY' + _PROP_PARAMS + rb':([^\r\n]*)', re.MULTILINE | re.IGNORECASE)
+# Cheap pre-check for the process_calendar workout filter, run on raw bytes
+# so non-workout events are never decoded
+_SUMMARY_FILTER = re.compile(rb'^SUMMARY[^\r\n]*(?:run|workout)', re.MULTILINE | re.IGNORECASE)
+_DESCRIPTION_PROP_RE = re.compile(rb'^DESCRIPTION' + _PROP_PARAMS + rb':([^\r\n]*)', re.MULTILINE | re.IGNORECASE)
+_DTSTART_PROP_RE = re.compile(rb'^DTSTART(' + _PROP_PARAMS + rb'):([^\r\n]*)', re.MULTILINE | re.IGNORECASE)
+_DATE_VALUE_RE = re.compile(r'(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2})(Z?))?')
+_TZID_PARAM_RE = re.compile(rb';TZID=("?)([^;:"]*)\1', re.IGNORECASE)
+_TEXT_ESCAPE_RE = re.compile(r'\\([\\;,nN])')
+_TEXT_UNESCAPES = {'\\': '\\', ';': ';', ',': ',', 'n': '\n', 'N': '\n'}
+
+# HTTP connection pool size and retry policy. POST is not retried to avoid
+# creating duplicate workouts when a failed response was in fact applied.
+# The last response is returned after retries so raise_for_status() applies.
+HTTP_POOL_SIZE = 32
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'PUT', 'DELETE']),
+    raise_on_status=False
+)
+
+
+def _pooled_session() -> requests.Session:
+    """Create a requests session with a pooled, retrying HTTPS adapter"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Session shared by every client in the module (ICS downloads and the
+# intervals.icu API); credentials are passed per request, never stored on it
+_SHARED_SESSION = _pooled_session()
+
+# Read size when streaming the ICS response
+ICS_CHUNK_SIZE = 64 * 1024
+
+# On-disk cache of downloaded calendars for conditional requests
+# (set ICS_CACHE_DIR to an empty string to disable)
+ICS_CACHE_DIR = os.environ.get('ICS_CACHE_DIR', '.ics_cache')
+# None until first use, False once found to be unavailable
+_ics_cache = None
+
+
+def _get_ics_cache(logger: Optional['StructuredLogger'] = None):
+    """
+    Open the ICS cache on first use
+    
+    The cache is optional, so a cache directory that can't be created or
+    opened (e.g. a read-only working directory) only disables caching.
+    
+    Args:
+        logger: Optional logger for a warning when the cache can't be opened
+    
+    Returns:
+        diskcache.Cache, or None if caching is unavailable
+    """
+    global _ics_cache
+    if _ics_cache is None:
+        _ics_cache = False
+        if diskcache is not None and ICS_CACHE_DIR:
+            try:
+                _ics_cache = diskcache.Cache(ICS_CACHE_DIR)
+            except (OSError, sqlite3.Error) as e:
+                if logger:
+                    logger.warning("ICS cache unavailable, fetching without it",
+                                   cache_dir=ICS_CACHE_DIR, error=str(e))
+    return _ics_cache if _ics_cache is not False else None
+
+# Globally unique stamps for IntensityMap contents
+_intensity_map_versions = itertools.count()
+
+
+class IntensityMap(dict):
+    """
+    Intensity keyword mapping that keeps a compiled matcher in sync
+    
+    The keyword alternation is built lazily and discarded whenever the
+    mapping is modified, so runtime customisation (e.g.
+    converter.INTENSITY_MAP['zone 2'] = 2) is picked up on the next lookup.
+    Each modification also assigns a new version, which callers can use to
+    key caches of results derived from the mapping.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._invalidate()
+    
+    def _invalidate(self):
+        """Drop the derived lookups and stamp a new version"""
+        self._matcher = None
+        self._longest_first = None
+        self.version = next(_intensity_map_versions)
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._invalidate()
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._invalidate()
+    
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._invalidate()
+    
+    def setdefault(self, key, default=None):
+        self._invalidate()
+        return super().setdefault(key, default)
+    
+    def pop(self, *args):
+        self._invalidate()
+        return super().pop(*args)
+    
+    def popitem(self):
+        self._invalidate()
+        return super().popitem()
+    
+    def clear(self):
+        super().clear()
+        self._invalidate()
+    
+    def __ior__(self, other):
+        # dict.__ior__ wouldn't go through update()
+        self.update(other)
+        return self
+    
+    def longest_first(self):
+        """
+        Get the mapping as a tuple of (keyword, intensity), longest keyword first
+        
+        A keyword is always tried before any shorter keyword it contains
+        (e.g. "half marathon pace" before "marathon pace"). Ties keep
+        insertion order.
+        
+        Returns:
+            Tuple of (keyword, intensity) pairs
+        """
+        if self._longest_first is None:
+            self._longest_first = tuple(sorted(self.items(), key=lambda item: -len(item[0])))
+        return self._longest_first
+    
+    def matcher(self):
+        """
+        Get the compiled keyword pattern and per-keyword match payloads
+        
+        Keys are alternated in longest_first() order so that e.g. "half
+        marathon pace" wins over "marathon pace" at the same position. Priority follows
+        insertion order (lower is preferred), so the best match across a
+        text is simply the smallest payload.
+        
+        Returns:
+            Tuple of (compiled regex, {keyword: (priority, intensity, keyword)})
+        """
+        if self._matcher is None:
+            keys = [key for key, _ in self.longest_first()]
+            # (?!) never matches, for an empty mapping
+            pattern = re.compile('|'.join(map(re.escape, keys)) or '(?!)')
+            payloads = {key: (i, intensity, key) for i, (key, intensity) in enumerate(self.items())}
+            self._matcher = (pattern, payloads)
+        return self._matcher
+
+
+class _IntensityMapAttribute:
+    """
+    Class attribute holding an IntensityMap
+    
+    Any mapping assigned to the attribute, whether per instance
+    (converter.INTENSITY_MAP = {...}) or in a subclass body, is wrapped in
+    an IntensityMap, so plain dicts keep working.
+    """
+    
+    def __init__(self, mapping):
+        self.default = mapping if isinstance(mapping, IntensityMap) else IntensityMap(mapping)
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.default
+        return instance.__dict__.get(self.name, self.default)
+    
+    def __set__(self, instance, mapping):
+        if not isinstance(mapping, IntensityMap):
+            mapping = IntensityMap(mapping)
+        instance.__dict__[self.name] = mapping
+    
+    def __delete__(self, instance):
+        del instance.__dict__[self.name]
+
+
+@dataclass(frozen=True)
+class Interval:
+    """
+    A parsed workout interval
+    
+    Intervals are immutable since parsed results are cached and shared.
+    """
+    __slots__ = ('repeat', 'duration', 'distance', 'intensity', 'pace', 'type', 'text')
+    
+    repeat: int
+    duration: int
+    distance: float
+    intensity: int
+    pace: Optional[float]
+    type: str
+    text: str
+
+
+def _tokenize(text_lower: str) -> Tuple[int, float]:
+    """
+    Extract time and distance from lowercase text in one regex pass
+
+    The first hours, minutes and seconds quantities are summed, and the
+    first kilometre distance takes precedence over miles, which take
+    precedence over metres. This is the single parsing routine behind
+    parse_duration, parse_distance and the structured interval loop.
+
+    Args:
+        text_lower: Lowercased text (e.g. "1km @ tempo", "1h 15min")
+
+    Returns:
+        Tuple of (seconds, meters); 0 where not found
+    """
+    times = {}
+    distances = {}
+    for match in _QUANTITY_RE.finditer(text_lower):
+        unit = match.lastgroup
+        if unit in _SECONDS_PER_UNIT:
+            times.setdefault(unit, float(match.group(1)) * _SECONDS_PER_UNIT[unit])
+        else:
+            distances.setdefault(unit, float(match.group(1)) * _METERS_PER_UNIT[unit])
+    
+    seconds = int(sum(times.values()))
+    for unit in ('km', 'miles', 'meters'):
+        if unit in distances:
+            return seconds, distances[unit]
+    return seconds, 0
+
+
+def _unescape_text(value: bytes) -> str:
+    """Decode an ICS TEXT property value"""
+    return _TEXT_ESCAPE_RE.sub(lambda m: _TEXT_UNESCAPES[m.group(1)], value.decode('utf-8', 'replace'))
+
+
+def _iter_vevents(chunks: Iterable[bytes],
+                  summary_filter: Optional[re.Pattern] = None,
+                  counts: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Scan raw ICS data for VEVENTs without building icalendar components
+
+    Data is consumed incrementally: each event is yielded as soon as its
+    END:VEVENT line has arrived, and only the unfinished tail is buffered.
+    Only the properties used for conversion are extracted. Nested
+    components (e.g. VALARM) are skipped so their properties cannot shadow
+    the event's own.
+
+    Args:
+        chunks: Raw ICS file contents, in one or more pieces
+        summary_filter: Optional bytes pattern; events whose unfolded raw
+            text doesn't match are skipped before any decoding
+        counts: Optional dictionary; 'events' is incremented for every
+            VEVENT scanned, including skipped ones
+
+    Yields:
+        Dictionaries with 'summary', 'description' and 'dtstart' keys
+        (each present only if set on the event)
+    """
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        consumed = 0
+        for block_match in _VEVENT_RE.finditer(buf):
+            consumed = block_match.end()
+            if counts is not None:
+                counts['events'] = counts.get('events', 0) + 1
+            block = _FOLD_RE.sub(b'', block_match.group(1))
+            if summary_filter is None or summary_filter.search(block):
+                yield _parse_vevent_block(block)
+        if consumed:
+            del buf[:consumed]
+
+
+def _parse_vevent_block(block: bytes) -> Dict[str, Any]:
+    """Extract conversion properties from the unfolded body of one VEVENT"""
+    block = _SUBCOMPONENT_RE.sub(b'', block)
+    
+    event = {}
+    match = _SUMMARY_PROP_RE.search(block)
+    if match:
+        event['summary'] = _unescape_text(match.group(1))
+    match = _DESCRIPTION_PROP_RE.search(block)
+    if match:
+        event['description'] = _unescape_text(match.group(1))
+    match = _DTSTART_PROP_RE.search(block)
+    if match:
+        tzid = _TZID_PARAM_RE.search(match.group(1))
+        event['dtstart'] = _parse_date_value(
+            match.group(2).decode('ascii').strip(),
+            tzid.group(2).decode() if tzid else None
+        )
+    return event
+
+
+def _parse_date_value(value: str, tzid: Optional[str] = None):
+    """
+    Parse an ICS DATE or DATE-TIME value
+
+    Dates and floating/UTC date-times are parsed directly; anything else
+    (TZID-qualified times, periods, ...) is handed to icalendar.
+
+    Args:
+        value: Property value (e.g. "20260127", "20260127T070000Z")
+        tzid: TZID parameter, if any
+
+    Returns:
+        date or datetime
+    """
+    match = _DATE_VALUE_RE.fullmatch(value)
+    if match and tzid is None:
+        year, month, day, hour, minute, second, utc = match.groups()
+        if hour is None:
+            return date(int(year), int(month), int(day))
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                        tzinfo=timezone.utc if utc else None)
+    
+    from icalendar.prop import vDDDTypes
+    return vDDDTypes.from_ical(value, timezone=tzid)
 
 
 class LogLevel(Enum):
@@ -31,12 +434,25 @@ class LogLevel(Enum):
     ERROR = "ERROR"
 
 
+# Text log timestamp format (microseconds and Z are appended)
+_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+
 class StructuredLogger:
     """
     Structured logger compatible with Cloudflare Workers and standard logging
     Outputs JSON-formatted logs for easy parsing in cloud environments
     """
     
+    # Level priorities
+    _DEBUG_P, _INFO_P, _WARNING_P, _ERROR_P = 0, 1, 2, 3
+    _level_priority = {
+        LogLevel.DEBUG: _DEBUG_P,
+        LogLevel.INFO: _INFO_P,
+        LogLevel.WARNING: _WARNING_P,
+        LogLevel.ERROR: _ERROR_P
+    }
+    
     def __init__(self, level: str = "INFO", use_json: bool = True):
         """
         Initialize structured logger
@@ -47,52 +463,68 @@ class StructuredLogger:
         """
         self.level = LogLevel[level.upper()]
         self.use_json = use_json
-        self._level_priority = {
-            LogLevel.DEBUG: 0,
-            LogLevel.INFO: 1,
-            LogLevel.WARNING: 2,
-            LogLevel.ERROR: 3
-        }
     
-    def _should_log(self, level: LogLevel) -> bool:
-        """Check if message should be logged based on current level"""
-        return self._level_priority[level] >= self._level_priority[self.level]
+    @property
+    def level(self) -> LogLevel:
+        """Current log level"""
+        return self._level
+    
+    @level.setter
+    def level(self, level: LogLevel):
+        self._level = level
+        # Cached so disabled levels cost a single integer comparison;
+        # callers can check debug_enabled before building expensive kwargs
+        self._threshold = self._level_priority[level]
+        self.debug_enabled = self._threshold <= self._DEBUG_P
     
     def _log(self, level: LogLevel, message: str, **kwargs):
-        """Internal log method"""
-        if not self._should_log(level):
-            return
-        
-        log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "level": level.value,
-            "message": message,
-            **kwargs
-        }
-        
+        """Internal log method (level is checked by the public wrappers)"""
         if self.use_json:
-            print(json.dumps(log_data), file=sys.stderr)
+            # orjson formats the datetime natively (as ...Z)
+            log_data = {
+                "timestamp": datetime.now(timezone.utc),
+                "level": level.value,
+                "message": message,
+                **kwargs
+            }
+            line = _dumps(log_data) + b"\n"
+            stream = getattr(sys.stderr, 'buffer', None)
+            if stream is not None:
+                stream.write(line)
+                stream.flush()
+            else:
+                sys.stderr.write(line.decode())
         else:
+            secs, nanos = divmod(time.time_ns(), 1_000_000_000)
+            timestamp = f"{time.strftime(_TIMESTAMP_FORMAT, time.gmtime(secs))}.{nanos // 1000:06d}Z"
             extra_info = " ".join(f"{k}={v}" for k, v in kwargs.items() if k != "timestamp")
-            log_line = f"[{log_data['timestamp']}] {level.value}: {message}"
+            log_line = f"[{timestamp}] {level.value}: {message}"
             if extra_info:
                 log_line += f" | {extra_info}"
             print(log_line, file=sys.stderr)
     
     def debug(self, message: str, **kwargs):
         """Log debug message"""
+        if self._DEBUG_P < self._threshold:
+            return
         self._log(LogLevel.DEBUG, message, **kwargs)
     
     def info(self, message: str, **kwargs):
         """Log info message"""
+        if self._INFO_P < self._threshold:
+            return
         self._log(LogLevel.INFO, message, **kwargs)
     
     def warning(self, message: str, **kwargs):
         """Log warning message"""
+        if self._WARNING_P < self._threshold:
+            return
         self._log(LogLevel.WARNING, message, **kwargs)
     
     def error(self, message: str, **kwargs):
         """Log error message"""
+        if self._ERROR_P < self._threshold:
+            return
         self._log(LogLevel.ERROR, message, **kwargs)
 
 
@@ -116,12 +548,10 @@ class IntervalsICUAPI:
         self.base_url = "https://intervals.icu/api/v1"
         self.logger = logger or StructuredLogger()
         
-        # Setup authentication
-        self.session = requests.Session()
-        self.session.auth = (f"API_KEY", api_key)
-        self.session.headers.update({
-            'Content-Type': 'application/json'
-        })
+        # Setup authentication (sent with each request, since the session
+        # is shared; json= bodies set the Content-Type header)
+        self.session = _SHARED_SESSION
+        self.auth = ("API_KEY", api_key)
     
     def create_workout(self, workout: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -140,7 +570,7 @@ class IntervalsICUAPI:
                         date=workout.get('workout_date'))
         
         try:
-            response = self.session.post(url, json=workout)
+            response = self.session.post(url, json=workout, auth=self.auth)
             response.raise_for_status()
             
             result = response.json()
@@ -175,7 +605,7 @@ class IntervalsICUAPI:
         self.logger.info("Updating workout", workout_id=workout_id)
         
         try:
-            response = self.session.put(url, json=workout)
+            response = self.session.put(url, json=workout, auth=self.auth)
             response.raise_for_status()
             
             result = response.json()
@@ -211,7 +641,7 @@ class IntervalsICUAPI:
             params['newest'] = end_date
         
         try:
-            response = self.session.get(url, params=params)
+            response = self.session.get(url, params=params, auth=self.auth)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -231,7 +661,7 @@ class IntervalsICUAPI:
         url = f"{self.base_url}/athlete/{self.athlete_id}/workouts/{workout_id}"
         
         try:
-            response = self.session.delete(url)
+            response = self.session.delete(url, auth=self.auth)
             response.raise_for_status()
             self.logger.info("Workout deleted successfully", workout_id=workout_id)
             return True
@@ -244,7 +674,7 @@ class RunnaWorkoutConverter:
     """Converts Runna workouts to intervals.icu format"""
     
     # Pace/intensity mappings
-    INTENSITY_MAP = {
+    INTENSITY_MAP = _IntensityMapAttribute({
         'easy': 1,
         'moderate': 2,
         'steady': 3,
@@ -257,7 +687,23 @@ class RunnaWorkoutConverter:
         'half marathon pace': 5,
         '10k pace': 6,
         '5k pace': 7,
-    }
+    })
+    
+    # Maximum number of parsed descriptions kept per converter
+    PARSE_CACHE_SIZE = 1024
+    
+    # Concurrent workout uploads when using the API client
+    UPLOAD_WORKERS = 8
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A subclass body's plain INTENSITY_MAP dict replaces the attribute
+        # outright, so wrap it again
+        mapping = cls.__dict__.get('INTENSITY_MAP')
+        if mapping is not None and not isinstance(mapping, _IntensityMapAttribute):
+            attribute = _IntensityMapAttribute(mapping)
+            attribute.__set_name__(cls, 'INTENSITY_MAP')
+            cls.INTENSITY_MAP = attribute
     
     def __init__(self, ics_url: str, logger: Optional[StructuredLogger] = None, 
                  api_client: Optional[IntervalsICUAPI] = None):
@@ -273,30 +719,91 @@ class RunnaWorkoutConverter:
         self.workouts = []
         self.logger = logger or StructuredLogger()
         self.api_client = api_client
+        self._parse_cache = OrderedDict()
     
-    def fetch_calendar(self) -> Calendar:
+    def _iter_calendar_chunks(self) -> Iterator[bytes]:
         """
-        Fetch ICS calendar from HTTP location
+        Download raw ICS data from HTTP location, yielding it as it arrives
+        
+        When the ICS cache is available, the previous ETag/Last-Modified are
+        sent as conditional headers and the cached body is reused on 304.
         
         Returns:
-            Calendar object
+            Iterator over chunks of the ICS file contents
         """
         self.logger.info("Fetching calendar", url=self.ics_url)
         
+        cache = _get_ics_cache(self.logger)
+        cached = None
+        if cache is not None:
+            try:
+                cached = cache.get(self.ics_url)
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning("ICS cache read failed, fetching without it", error=str(e))
+                cache = None
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
         try:
-            response = requests.get(self.ics_url, timeout=30)
-            response.raise_for_status()
-            
-            self.logger.debug("Calendar fetched successfully", 
-                            status_code=response.status_code,
-                            content_length=len(response.content))
-            
-            cal = Calendar.from_ical(response.content)
-            return cal
+            with _SHARED_SESSION.get(self.ics_url, headers=headers, timeout=30, stream=True) as response:
+                if response.status_code == 304 and cached:
+                    self.logger.debug("Calendar not modified, using cached copy",
+                                    content_length=len(cached[2]))
+                    yield cached[2]
+                    return
+                
+                response.raise_for_status()
+                
+                # The full body is only kept if it is going to be cached
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                body = [] if cache is not None and (etag or last_modified) else None
+                content_length = 0
+                
+                for chunk in response.iter_content(chunk_size=ICS_CHUNK_SIZE):
+                    content_length += len(chunk)
+                    if body is not None:
+                        body.append(chunk)
+                    yield chunk
+                
+                self.logger.debug("Calendar fetched successfully", 
+                                status_code=response.status_code,
+                                content_length=content_length)
+                
+                if body is not None:
+                    try:
+                        cache.set(self.ics_url, (etag, last_modified, b''.join(body)))
+                    except (OSError, sqlite3.Error) as e:
+                        self.logger.warning("ICS cache write failed", error=str(e))
         except requests.RequestException as e:
             self.logger.error("Failed to fetch calendar", error=str(e), url=self.ics_url)
             raise
     
+    def _download_calendar(self) -> bytes:
+        """
+        Download raw ICS data from HTTP location
+        
+        Returns:
+            ICS file contents
+        """
+        return b''.join(self._iter_calendar_chunks())
+    
+    def fetch_calendar(self) -> 'Calendar':
+        """
+        Fetch ICS calendar from HTTP location
+        
+        Returns:
+            Calendar object
+        """
+        from icalendar import Calendar
+        
+        return Calendar.from_ical(self._download_calendar())
+    
     def parse_duration(self, duration_text: str) -> int:
         """
         Parse duration text to seconds
@@ -307,26 +814,12 @@ class RunnaWorkoutConverter:
         Returns:
             Duration in seconds
         """
-        duration_text = duration_text.lower().strip()
-        total_seconds = 0
-        
-        # Match hours
-        hours_match = re.search(r'(\d+)\s*h(?:our)?s?', duration_text)
-        if hours_match:
-            total_seconds += int(hours_match.group(1)) * 3600
-        
-        # Match minutes
-        minutes_match = re.search(r'(\d+)\s*m(?:in)?(?:ute)?s?', duration_text)
-        if minutes_match:
-            total_seconds += int(minutes_match.group(1)) * 60
-        
-        # Match seconds
-        seconds_match = re.search(r'(\d+)\s*s(?:ec)?(?:ond)?s?', duration_text)
-        if seconds_match:
-            total_seconds += int(seconds_match.group(1))
+        duration_text = duration_text.lower()
+        total_seconds, _ = _tokenize(duration_text)
         
         result = total_seconds if total_seconds > 0 else 1800  # Default 30 min
-        self.logger.debug("Parsed duration", text=duration_text, seconds=result)
+        if self.logger.debug_enabled:
+            self.logger.debug("Parsed duration", text=duration_text, seconds=result)
         return result
     
     def parse_distance(self, distance_text: str) -> float:
@@ -339,24 +832,8 @@ class RunnaWorkoutConverter:
         Returns:
             Distance in meters
         """
-        distance_text = distance_text.lower().strip()
-        
-        # Match kilometers
-        km_match = re.search(r'(\d+\.?\d*)\s*k(?:m)?', distance_text)
-        if km_match:
-            return float(km_match.group(1)) * 1000
-        
-        # Match miles
-        mile_match = re.search(r'(\d+\.?\d*)\s*mi(?:le)?s?', distance_text)
-        if mile_match:
-            return float(mile_match.group(1)) * 1609.34
-        
-        # Match meters
-        meter_match = re.search(r'(\d+)\s*m(?:eter)?s?', distance_text)
-        if meter_match:
-            return float(meter_match.group(1))
-        
-        return 0
+        _, meters = _tokenize(distance_text.lower())
+        return meters
     
     def extract_intensity(self, text: str) -> int:
         """
@@ -368,15 +845,23 @@ class RunnaWorkoutConverter:
         Returns:
             Intensity level (1-7)
         """
-        text_lower = text.lower()
-        
-        for pace_key, intensity in self.INTENSITY_MAP.items():
-            if pace_key in text_lower:
-                self.logger.debug("Matched intensity", pace=pace_key, level=intensity)
-                return intensity
+        return self._extract_intensity_lower(text.lower())
+    
+    def _extract_intensity_lower(self, text_lower: str) -> int:
+        """Extract intensity from already-lowercased text"""
+        intensity_re, payloads = self.INTENSITY_MAP.matcher()
+        
+        # Single scan; earlier INTENSITY_MAP entries take precedence
+        best = min(map(payloads.__getitem__, intensity_re.findall(text_lower)), default=None)
+        if best is not None:
+            _, intensity, pace_key = best
+            if self.logger.debug_enabled:
+                self.logger.debug("Matched intensity", pace=pace_key, intensity=intensity)
+            return intensity
         
         # Default to moderate
-        self.logger.debug("Using default intensity", level=2)
+        if self.logger.debug_enabled:
+            self.logger.debug("Using default intensity", intensity=2)
         return 2
     
     def parse_pace(self, text: str) -> Optional[float]:
@@ -389,15 +874,18 @@ class RunnaWorkoutConverter:
         Returns:
             Pace in seconds per km, or None if not found
         """
-        # Pattern: 4:50/km or 4:50 /km or 4:50/k
-        pace_pattern = r'(\d+):(\d+)\s*/?k(?:m)?'
-        match = re.search(pace_pattern, text)
+        # Most workout text has no pace at all; skip the regex for it
+        if ':' not in text:
+            return None
+        
+        match = _PACE_RE.search(text)
         
         if match:
             minutes = int(match.group(1))
             seconds = int(match.group(2))
             pace_seconds = minutes * 60 + seconds
-            self.logger.debug("Parsed pace", text=text, pace_seconds=pace_seconds)
+            if self.logger.debug_enabled:
+                self.logger.debug("Parsed pace", text=text, pace_seconds=pace_seconds)
             return float(pace_seconds)
         
         return None
@@ -415,7 +903,8 @@ class RunnaWorkoutConverter:
         z1_max = pace_seconds + 150
         
         # Z2-Z3: easy to moderate (subtract 0:30, add 2:30)
-        z2_z3_min = max(pace_seconds - 30, pace_seconds * 0.9)
+        # (the larger of pace - 0:30 and 90% of pace; they cross at 5:00/km)
+        z2_z3_min = pace_seconds - 30 if pace_seconds >= 300 else pace_seconds * 0.9
         z2_z3_max = pace_seconds + 150
         
         return (z1_min, z1_max, z2_z3_min, z2_z3_max)
@@ -430,9 +919,9 @@ class RunnaWorkoutConverter:
         Returns:
             Formatted pace string (e.g., "4:50")
         """
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes}:{secs:02d}"
+        # Paces are positive, so truncating once is the same as flooring
+        minutes, secs = divmod(int(seconds), 60)
+        return f"{minutes}:{secs:02}"
     
     def create_pace_target(self, pace_seconds: Optional[float], is_recovery: bool = False, 
                           is_easy: bool = False) -> Dict[str, Any]:
@@ -501,18 +990,48 @@ class RunnaWorkoutConverter:
             }
 
     
-    def parse_workout_description(self, description: str, summary: str) -> List[Dict[str, Any]]:
+    def parse_workout_description(self, description: str, summary: str) -> Tuple['Interval', ...]:
         """
         Parse workout description into intervals
         
+        Results are cached, so workouts repeated across weeks are only parsed
+        once. The returned intervals are shared between calls and must not be
+        modified.
+        
+        Args:
+            description: Full workout description
+            summary: Workout summary/title
+            
+        Returns:
+            Tuple of Interval objects
+        """
+        key = (description, summary, self.INTENSITY_MAP.version)
+        intervals = self._parse_cache.get(key)
+        if intervals is not None:
+            self._parse_cache.move_to_end(key)
+            if self.logger.debug_enabled:
+                self.logger.debug("Using cached workout intervals", summary=summary)
+            return intervals
+        
+        intervals = tuple(self._parse_workout_description(description, summary))
+        self._parse_cache[key] = intervals
+        if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return intervals
+    
+    def _parse_workout_description(self, description: str, summary: str) -> List['Interval']:
+        """
+        Parse workout description into intervals (uncached)
+        
         Args:
             description: Full workout description
             summary: Workout summary/title
             
         Returns:
-            List of interval dictionaries
+            List of Interval objects
         """
-        self.logger.debug("Parsing workout", summary=summary)
+        if self.logger.debug_enabled:
+            self.logger.debug("Parsing workout", summary=summary)
         intervals = []
         
         # Common patterns in Runna workouts
@@ -523,8 +1042,7 @@ class RunnaWorkoutConverter:
         
         # Try to find structured intervals
         # Pattern: Number x (duration/distance @ intensity, rest)
-        interval_pattern = r'(\d+)\s*x\s*\(([^)]+)\)'
-        matches = re.finditer(interval_pattern, text, re.IGNORECASE)
+        matches = _INTERVAL_RE.finditer(text)
         
         has_structured_intervals = False
         for match in matches:
@@ -532,82 +1050,94 @@ class RunnaWorkoutConverter:
             reps = int(match.group(1))
             interval_text = match.group(2)
             
-            self.logger.debug("Found structured interval", reps=reps, text=interval_text)
+            if self.logger.debug_enabled:
+                self.logger.debug("Found structured interval", reps=reps, text=interval_text)
             
             # Parse the interval components
-            parts = re.split(r',|and', interval_text)
+            parts = _SPLIT_RE.split(interval_text)
             
             for part in parts:
                 part = part.strip()
                 if not part:
                     continue
                 
-                duration = self.parse_duration(part) if 'min' in part or 'hour' in part else 0
-                distance = self.parse_distance(part) if 'km' in part or 'm' in part or 'k ' in part else 0
-                intensity = self.extract_intensity(part)
+                # One tokenizing pass instead of separate duration/distance
+                # parses, and one classifying pass instead of substring tests
+                part_lower = part.lower()
+                seconds, meters = _tokenize(part_lower)
+                flags = 0
+                for class_match in _CLASSIFY_RE.finditer(part_lower):
+                    flags |= _CLASSIFY_BITS[class_match.lastgroup]
+                duration = (seconds or 1800) if flags & _TIME_BIT else 0
+                distance = meters if flags & _DISTANCE_BIT else 0
+                if self.logger.debug_enabled:
+                    self.logger.debug("Tokenized interval part", text=part,
+                                    seconds=duration, meters=distance)
+                intensity = self._extract_intensity_lower(part_lower)
                 pace = self.parse_pace(part)  # Extract actual pace
                 
-                if 'recovery' in part.lower() or 'rest' in part.lower():
+                if flags & _REST_BIT:
                     interval_type = 'recovery'
                     intensity = 1
                 else:
                     interval_type = 'work'
                 
-                intervals.append({
-                    'repeat': reps,
-                    'duration': duration,
-                    'distance': distance,
-                    'intensity': intensity,
-                    'pace': pace,  # Store parsed pace
-                    'type': interval_type,
-                    'text': part
-                })
+                intervals.append(Interval(
+                    repeat=reps,
+                    duration=duration,
+                    distance=distance,
+                    intensity=intensity,
+                    pace=pace,  # Store parsed pace
+                    type=interval_type,
+                    text=part
+                ))
         
         # If no structured intervals found, create a simple workout
         if not has_structured_intervals:
-            self.logger.debug("No structured intervals found, creating simple workout")
+            if self.logger.debug_enabled:
+                self.logger.debug("No structured intervals found, creating simple workout")
             
             # Look for warm up
-            warmup_match = re.search(r'warm\s*up\s+(\d+(?:\s*min)?)', text, re.IGNORECASE)
+            warmup_match = _WARMUP_RE.search(text)
             if warmup_match:
                 duration = self.parse_duration(warmup_match.group(1))
-                intervals.append({
-                    'repeat': 1,
-                    'duration': duration,
-                    'distance': 0,
-                    'intensity': 1,
-                    'pace': None,
-                    'type': 'warmup',
-                    'text': 'Warm up'
-                })
+                intervals.append(Interval(
+                    repeat=1,
+                    duration=duration,
+                    distance=0,
+                    intensity=1,
+                    pace=None,
+                    type='warmup',
+                    text='Warm up'
+                ))
             
             # Main work
             main_intensity = self.extract_intensity(text)
             main_duration = self.parse_duration(summary) if 'min' in summary else 1800
             main_pace = self.parse_pace(text)
-            intervals.append({
-                'repeat': 1,
-                'duration': main_duration,
-                'distance': 0,
-                'intensity': main_intensity,
-                'pace': main_pace,
-                'type': 'work',
-                'text': summary
-            })
+            intervals.append(Interval(
+                repeat=1,
+                duration=main_duration,
+                distance=0,
+                intensity=main_intensity,
+                pace=main_pace,
+                type='work',
+                text=summary
+            ))
             
             # Look for cool down
-            cooldown_match = re.search(r'cool\s*down\s+(\d+(?:\s*min)?)', text, re.IGNORECASE)
+            cooldown_match = _COOLDOWN_RE.search(text)
             if cooldown_match:
                 duration = self.parse_duration(cooldown_match.group(1))
-                intervals.append({
-                    'repeat': 1,
-                    'duration': duration,
-                    'distance': 0,
-                    'intensity': 1,
-                    'pace': None,
-                    'type': 'cooldown',
-                    'text': 'Cool down'
-                })
+                intervals.append(Interval(
+                    repeat=1,
+                    duration=duration,
+                    distance=0,
+                    intensity=1,
+                    pace=None,
+                    type='cooldown',
+                    text='Cool down'
+                ))
         
         self.logger.info("Parsed workout intervals", summary=summary, interval_count=len(intervals))
         return intervals
@@ -617,16 +1147,20 @@ class RunnaWorkoutConverter:
         Convert a calendar event to intervals.icu workout format
         
         Args:
-            event: iCalendar event object
+            event: iCalendar event object, or an event dictionary from
+                _iter_vevents()
             
         Returns:
             Dictionary in intervals.icu workout format
         """
         summary = str(event.get('summary', 'Runna Workout'))
         description = str(event.get('description', ''))
-        start_date = event.get('dtstart').dt if event.get('dtstart') else datetime.now()
+        dtstart = event.get('dtstart')
+        # icalendar properties wrap the value in .dt
+        start_date = getattr(dtstart, 'dt', dtstart) if dtstart else datetime.now()
         
-        self.logger.debug("Converting event to intervals.icu format", summary=summary)
+        if self.logger.debug_enabled:
+            self.logger.debug("Converting event to intervals.icu format", summary=summary)
         
         # Parse intervals from description
         intervals = self.parse_workout_description(description, summary)
@@ -641,61 +1175,48 @@ class RunnaWorkoutConverter:
         
         # Convert intervals to steps
         for interval in intervals:
-            step = {
-                'repeat': interval['repeat'],
-                'steps': []
-            }
-            
             # Determine if recovery or easy
-            is_recovery = interval['type'] == 'recovery' or 'recovery' in interval['text'].lower() or 'rest' in interval['text'].lower()
-            is_easy = interval['type'] in ['warmup', 'cooldown'] or 'easy' in interval['text'].lower() or 'conversational' in interval['text'].lower()
+            text_lower = interval.text.lower()
+            is_recovery = interval.type == 'recovery' or 'recovery' in text_lower or 'rest' in text_lower
+            is_easy = interval.type in ['warmup', 'cooldown'] or 'easy' in text_lower or 'conversational' in text_lower
             
             # Create pace target
-            pace_target = self.create_pace_target(interval.get('pace'), is_recovery=is_recovery, is_easy=is_easy)
+            pace_target = self.create_pace_target(interval.pace, is_recovery=is_recovery, is_easy=is_easy)
             
             # Build text description with pace
-            if interval.get('pace'):
-                pace_str = self.format_pace(interval['pace'])
+            if interval.pace:
+                pace_str = self.format_pace(interval.pace)
                 if is_recovery:
                     # Calculate recovery range
-                    z1_min, z1_max, _, _ = self.pace_to_zone_range(interval['pace'])
-                    text = f"{interval['text']} ({pace_str}-{self.format_pace(z1_max)}/km Z1)"
+                    z1_min, z1_max, _, _ = self.pace_to_zone_range(interval.pace)
+                    text = f"{interval.text} ({pace_str}-{self.format_pace(z1_max)}/km Z1)"
                 elif is_easy:
                     # Calculate easy range
-                    _, _, z2_z3_min, z2_z3_max = self.pace_to_zone_range(interval['pace'])
-                    text = f"{interval['text']} ({self.format_pace(z2_z3_min)}-{self.format_pace(z2_z3_max)}/km Z1-Z3)"
+                    _, _, z2_z3_min, z2_z3_max = self.pace_to_zone_range(interval.pace)
+                    text = f"{interval.text} ({self.format_pace(z2_z3_min)}-{self.format_pace(z2_z3_max)}/km Z1-Z3)"
                 else:
-                    text = f"{interval['text']} ({pace_str}/km)"
+                    text = f"{interval.text} ({pace_str}/km)"
             else:
-                text = interval['text']
+                text = interval.text
             
-            # Determine step type
-            if interval['duration'] > 0:
-                step_data = {
-                    'duration': interval['duration'],
-                    'durationType': 'time',
-                    **pace_target,
-                    'text': text
-                }
-            elif interval['distance'] > 0:
-                step_data = {
-                    'distance': interval['distance'],
-                    'durationType': 'distance',
-                    **pace_target,
-                    'text': text
-                }
+            # Determine step type (default to time-based)
+            if interval.duration > 0:
+                length_key, length, duration_type = 'duration', interval.duration, 'time'
+            elif interval.distance > 0:
+                length_key, length, duration_type = 'distance', interval.distance, 'distance'
             else:
-                # Default to time-based
-                step_data = {
-                    'duration': 1800,
-                    'durationType': 'time',
-                    **pace_target,
-                    'text': text
-                }
+                length_key, length, duration_type = 'duration', 1800, 'time'
+            
+            step_data = {
+                length_key: length,
+                'durationType': duration_type,
+                **pace_target,
+                'text': text
+            }
             
-            if interval['repeat'] > 1:
-                step['steps'].append(step_data)
-                workout['steps'].append(step)
+            # Only repeated intervals need a wrapper step
+            if interval.repeat > 1:
+                workout['steps'].append({'repeat': interval.repeat, 'steps': [step_data]})
             else:
                 workout['steps'].append(step_data)
         
@@ -713,41 +1234,41 @@ class RunnaWorkoutConverter:
         """
         self.logger.info("Starting calendar processing", upload_to_api=upload_to_api)
         
-        cal = self.fetch_calendar()
         workouts = []
-        event_count = 0
+        counts = {'events': 0}
         uploaded_count = 0
         
-        for component in cal.walk():
-            if component.name == "VEVENT":
-                event_count += 1
-                summary = str(component.get('summary', ''))
-                
-                # Filter for Runna workouts (adjust this filter as needed)
-                if 'run' in summary.lower() or 'workout' in summary.lower():
-                    workout = self.convert_to_intervals_icu(component)
-                    workouts.append(workout)
-                    self.logger.info("Converted workout", 
-                                   name=workout['name'], 
-                                   date=workout['workout_date'],
-                                   steps=len(workout['steps']))
-                    
-                    # Upload to API if requested
-                    if upload_to_api and self.api_client:
-                        result = self.api_client.create_workout(workout)
-                        if result:
-                            uploaded_count += 1
+        events = _iter_vevents(self._iter_calendar_chunks(), summary_filter=_SUMMARY_FILTER, counts=counts)
+        for event in events:
+            summary_lower = event.get('summary', '').lower()
+            
+            # Filter for Runna workouts (adjust this filter as needed)
+            if 'run' in summary_lower or 'workout' in summary_lower:
+                workout = self.convert_to_intervals_icu(event)
+                workouts.append(workout)
+                self.logger.info("Converted workout", 
+                               name=workout['name'], 
+                               date=workout['workout_date'],
+                               steps=len(workout['steps']))
+        
+        # Upload to API if requested; each upload is independent, so they
+        # run concurrently over the pooled session
+        if upload_to_api and self.api_client and workouts:
+            with ThreadPoolExecutor(max_workers=self.UPLOAD_WORKERS) as executor:
+                futures = [executor.submit(self.api_client.create_workout, workout)
+                           for workout in workouts]
+                uploaded_count = sum(1 for future in as_completed(futures) if future.result())
         
         self.workouts = workouts
         
         if upload_to_api and self.api_client:
             self.logger.info("Calendar processing complete with API upload", 
-                            total_events=event_count,
+                            total_events=counts['events'],
                             workouts_converted=len(workouts),
                             workouts_uploaded=uploaded_count)
         else:
             self.logger.info("Calendar processing complete", 
-                            total_events=event_count,
+                            total_events=counts['events'],
                             workouts_converted=len(workouts))
         
         return workouts
@@ -761,8 +1282,8 @@ class RunnaWorkoutConverter:
         """
         self.logger.info("Saving workouts", filename=output_file, count=len(self.workouts))
         
-        with open(output_file, 'w') as f:
-            json.dump(self.workouts, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(_dumps(self.workouts, indent=True))
         
         self.logger.info("Workouts saved successfully", filename=output_file)
 
@@ -854,7 +1375,7 @@ def cloudflare_fetch_handler(request, env, ctx):
     
     if not ics_url:
         return Response(
-            json.dumps({'success': False, 'error': 'ICS_URL not configured'}),
+            _dumps({'success': False, 'error': 'ICS_URL not configured'}),
             status=500,
             headers={'Content-Type': 'application/json'}
         )
@@ -864,7 +1385,7 @@ def cloudflare_fetch_handler(request, env, ctx):
         workouts = converter.process_calendar()
         
         return Response(
-            json.dumps({
+            _dumps({
                 'success': True,
                 'workouts': workouts,
                 'count': len(workouts)
@@ -876,7 +1397,7 @@ def cloudflare_fetch_handler(request, env, ctx):
     except Exception as e:
         logger.error("HTTP handler failed", error=str(e))
         return Response(
-            json.dumps({'success': False, 'error': str(e)}),
+            _dumps({'success': False, 'error': str(e)}),
             status=500,
             headers={'Content-Type': 'application/json'}
         )
@@ -984,7 +1505,7 @@ def main():
             
             if args.log_level == 'DEBUG':
                 print("\n=== Sample Workout ===")
-                print(json.dumps(workouts[0], indent=2))
+                print(_dumps(workouts[0], indent=True).decode())
         else:
             logger.warning("No workouts found in calendar")
             print("No workouts found in calendar")
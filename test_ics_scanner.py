@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test the streaming VEVENT scanner against icalendar
+
+Parses test_ics_fixture.ics (quoted parameters containing ':' and ';',
+lowercase property names, folded lines, TZID and DATE starts, and a VALARM
+with its own DESCRIPTION) with both icalendar and _iter_vevents, and
+checks that they extract the same summary, description and start.
+"""
+
+import os
+import sys
+
+from icalendar import Calendar
+
+from runna_to_intervals import _iter_vevents
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_ics_fixture.ics')
+
+with open(FIXTURE, 'rb') as f:
+    data = f.read()
+
+expected = [
+    {
+        'summary': str(component.get('summary')),
+        'description': str(component.get('description')),
+        'dtstart': component.get('dtstart').dt,
+    }
+    for component in Calendar.from_ical(data).walk('VEVENT')
+]
+scanned = list(_iter_vevents([data]))
+
+print("=" * 80)
+print("Testing VEVENT Scanner Against icalendar")
+print("=" * 80)
+print()
+
+failures = 0
+if len(scanned) != len(expected):
+    failures += 1
+    print(f"✗ Event count: icalendar {len(expected)}, scanner {len(scanned)}")
+
+for want, got in zip(expected, scanned):
+    for key in ('summary', 'description', 'dtstart'):
+        if got.get(key) == want[key]:
+            print(f"✓ {key:11} {want[key]!r}")
+        else:
+            failures += 1
+            print(f"✗ {key:11} icalendar {want[key]!r}, scanner {got.get(key)!r}")
+    print()
+
+print("=" * 80)
+print("✓ Test Complete!" if not failures else f"✗ {failures} mismatches")
+print("=" * 80)
+sys.exit(1 if failures else 0)
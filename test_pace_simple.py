@@ -4,43 +4,167 @@ Test pace parsing functions
 """
 
 import re
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from typing import Optional, Dict, Any
 
+# Optional DFA-based regex engine (google-re2) for the bulk pace sweep
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Report banners
+_BAR = "=" * 80
+_DASH = "-" * 80
+
+# Same pace format as parse_pace, for sweeping many texts at once; the
+# bytes form is used for ASCII-only input, where it matches identically.
+# It spells out whitespace, since str \s also covers \x1c-\x1f and re2's
+# \s omits \v, and uses re2 when installed (ASCII \b and \d agree).
+_PACE_RE = re.compile(r'\b(\d{1,2}):(\d{2})\s*/km\b')
+_PACE_RE_B = (re2 or re).compile(rb'\b(\d{1,2}):(\d{2})[ \t\n\r\f\v\x1c-\x1f]*/km\b')
+
+def _is_word_char(char: str) -> bool:
+    """Whether char would match \\w (i.e. there is no word boundary next to it)"""
+    return char.isalnum() or char == '_'
+
+# Seconds per km for every common training pace (3:00-11:59/km), keyed by
+# the digits as they appear in the text, so hits skip int()
+_PACE_LUT = {
+    (minutes, f"{sec:02}"): float(m * 60 + sec)
+    for m in range(3, 12)
+    for sec in range(60)
+    for minutes in {str(m), f"{m:02}"}
+}
+
+def _pace_seconds(minutes: str, seconds: str) -> float:
+    """Numeric core of pace parsing: M:SS digits -> seconds per km"""
+    pace = _PACE_LUT.get((minutes, seconds))
+    if pace is None:
+        pace = float(int(minutes) * 60 + int(seconds))
+    return pace
+
+def _pace_at(text: str, colon: int) -> Optional[float]:
+    """Parse an M:SS/km or MM:SS/km pace around the colon at index colon"""
+    # Minutes: one or two digits, starting at a word boundary
+    start = colon
+    while start > 0 and text[start - 1].isdecimal():
+        start -= 1
+    if not 1 <= colon - start <= 2 or (start > 0 and _is_word_char(text[start - 1])):
+        return None
+    
+    # Seconds: exactly two digits
+    secs = text[colon + 1:colon + 3]
+    if len(secs) != 2 or not secs.isdecimal():
+        return None
+    
+    # Optional whitespace, then "/km" ending at a word boundary
+    end = colon + 3
+    while end < len(text) and text[end].isspace():
+        end += 1
+    if not text.startswith('/km', end):
+        return None
+    end += 3
+    if end < len(text) and _is_word_char(text[end]):
+        return None
+    
+    return _pace_seconds(text[start:colon], secs)
+
 def parse_pace(text: str) -> Optional[float]:
     """Parse pace from text (e.g., "4:50/km" -> 290 seconds per km)"""
-    pace_pattern = r'(\d+):(\d+)\s*/?k(?:m)?'
-    match = re.search(pace_pattern, text)
-    
-    if match:
-        minutes = int(match.group(1))
-        seconds = int(match.group(2))
-        pace_seconds = minutes * 60 + seconds
-        return float(pace_seconds)
+    # A hand-written scan for 4:50/km or 4:50 /km: every pace has a colon,
+    # so only the text around each colon is examined, and most workout
+    # text has none at all
+    colon = text.find(':')
+    while colon != -1:
+        pace = _pace_at(text, colon)
+        if pace is not None:
+            return pace
+        colon = text.find(':', colon + 1)
     
     return None
 
+def _match_pace(match) -> float:
+    """Pace of a _PACE_RE match"""
+    return _pace_seconds(match.group(1), match.group(2))
+
+def _ascii_match_pace(match) -> float:
+    """Pace of a _PACE_RE_B match, read from the buffer by span (no group strings)"""
+    buf = match.string
+    start, end = match.span(1)
+    secs = match.start(2)
+    # Indexing bytes gives the code point; ASCII digits are 48-57
+    minutes = buf[start] - 48
+    if end - start == 2:
+        minutes = minutes * 10 + buf[start + 1] - 48
+    return float(minutes * 60 + (buf[secs] - 48) * 10 + buf[secs + 1] - 48)
+
+def parse_paces(texts: list) -> list:
+    """Parse the first pace in each of texts with a single regex sweep"""
+    # NUL can't be part of a pace, so joined on it no match spans two texts;
+    # each match is mapped back to its text by start offset
+    starts = list(accumulate((len(text) + 1 for text in texts[:-1]), initial=0))
+    joined = '\0'.join(texts)
+    if joined.isascii():
+        # Same offsets as the str
+        matches = _PACE_RE_B.finditer(joined.encode('ascii'))
+        match_pace = _ascii_match_pace
+    else:
+        matches = _PACE_RE.finditer(joined)
+        match_pace = _match_pace
+    
+    paces = [None] * len(texts)
+    for match in matches:
+        i = bisect_right(starts, match.start()) - 1
+        if paces[i] is None:
+            paces[i] = match_pace(match)
+    
+    return paces
+
+@lru_cache(maxsize=256)
 def format_pace(seconds: float) -> str:
     """Format pace in seconds to MM:SS format"""
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
-    return f"{minutes}:{secs:02d}"
-
-def pace_to_zone_range(pace_seconds: float) -> tuple:
-    """Convert pace to zone range for recovery/easy efforts"""
-    # Z1: slow recovery (add 1:00 to 2:30)
-    z1_min = pace_seconds + 60
-    z1_max = pace_seconds + 150
-    
-    # Z2-Z3: easy to moderate (subtract 0:30, add 2:30)
-    z2_z3_min = max(pace_seconds - 30, pace_seconds * 0.9)
-    z2_z3_max = pace_seconds + 150
+    # Paces are positive, so truncating once is the same as flooring
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes}:{secs:02}"
+
+def zone1_range(pace_seconds: float) -> tuple:
+    """Z1 range for recovery efforts: slow recovery (add 1:00 to 2:30)"""
+    return (pace_seconds + 60.0, pace_seconds + 150.0)
+
+def zone23_range(pace_seconds: float) -> tuple:
+    """Z2-Z3 range for easy efforts: easy to moderate (subtract 0:30, add 2:30)"""
+    # (the larger of pace - 0:30 and 90% of pace; they cross at 5:00/km)
+    z2_z3_min = pace_seconds - 30.0 if pace_seconds >= 300.0 else pace_seconds * 0.9
+    return (z2_z3_min, pace_seconds + 150.0)
+
+def pace_target_text(pace_sec: Optional[float], effort: str) -> str:
+    """Display text for a workout part's target"""
+    if pace_sec:
+        if effort == "recovery":
+            z1_min, z1_max = zone1_range(pace_sec)
+            return f" Z1 {format_pace(z1_min)}-{format_pace(z1_max)}/km"
+        if effort == "easy":
+            z2_z3_min, z2_z3_max = zone23_range(pace_sec)
+            return f" Z1-Z3 {format_pace(z2_z3_min)}-{format_pace(z2_z3_max)}/km"
+        return f" {format_pace(pace_sec)}/km"
     
-    return (z1_min, z1_max, z2_z3_min, z2_z3_max)
+    if effort == "recovery":
+        return " Z1 (recovery)"
+    if effort == "easy":
+        return " Z1-Z3 (easy)"
+    return f" {effort}"
+
+# Output is collected and written once at the end
+out = []
 
-print("=" * 80)
-print("Testing Pace Parsing and Conversion")
-print("=" * 80)
-print()
+out.append(_BAR)
+out.append("Testing Pace Parsing and Conversion")
+out.append(_BAR)
+out.append("")
 
 # Test cases
 test_cases = [
@@ -51,67 +175,55 @@ test_cases = [
     "2.2km cool down"
 ]
 
-print("Test 1: Pace Parsing")
-print("-" * 80)
-for text in test_cases:
-    pace = parse_pace(text)
+out.append("Test 1: Pace Parsing")
+out.append(_DASH)
+paces_parsed = [parse_pace(text) for text in test_cases]
+for text, pace in zip(test_cases, paces_parsed):
     if pace:
-        print(f"✓ '{text}' -> {format_pace(pace)}/km ({pace:.0f} seconds)")
+        out.append(f"✓ '{text}' -> {format_pace(pace)}/km ({pace:.0f} seconds)")
     else:
-        print(f"✗ '{text}' -> No pace found")
-print()
-
-print("Test 2: Expected K200s Workout Structure")
-print("-" * 80)
-print()
-
-workout_parts = [
-    ("Warm-up", "3km", None, "easy"),
-    ("Strides", "3x15s", None, "fast"),
-    ("Rest", "90s", None, "recovery"),
-    ("Main 1km", "1km", 4*60+50, "threshold"),
-    ("Main 200m", "200m", 4*60+20, "interval"),
-    ("Recovery", "120s", 4*60+50, "recovery"),
-    ("Cool-down", "2.2km", None, "easy")
-]
+        out.append(f"✗ '{text}' -> No pace found")
 
-for name, distance, pace_sec, effort in workout_parts:
-    print(f"{name:15} {distance:8}", end="")
-    
-    if pace_sec:
-        pace_str = format_pace(pace_sec)
-        
-        if effort == "recovery":
-            z1_min, z1_max, _, _ = pace_to_zone_range(pace_sec)
-            print(f" Z1 {format_pace(z1_min)}-{format_pace(z1_max)}/km", end="")
-        elif effort == "easy":
-            _, _, z2_z3_min, z2_z3_max = pace_to_zone_range(pace_sec)
-            print(f" Z1-Z3 {format_pace(z2_z3_min)}-{format_pace(z2_z3_max)}/km", end="")
-        else:
-            print(f" {pace_str}/km", end="")
-    else:
-        if effort == "recovery":
-            print(f" Z1 (recovery)", end="")
-        elif effort == "easy":
-            print(f" Z1-Z3 (easy)", end="")
-        else:
-            print(f" {effort}", end="")
-    
-    print()
-
-print()
-print("=" * 80)
-print("Expected intervals.icu Output Format:")
-print("=" * 80)
-print()
-print("Main Set 4x")
-print("  * 1km at 4:50/km Pace")
-print("  * 0.2km at 4:20/km Pace")
-print("  * 120s Z1 6:50-8:23/km (for 0.26km)")
-print()
-print("Cool-down:")
-print("  * 2.2km Z1-Z3 5:20-8:23/km")
-print()
-print("=" * 80)
-print("✓ Test Complete!")
-print("=" * 80)
+# The single-sweep bulk parser must agree with parse_pace
+if parse_paces(test_cases) == paces_parsed:
+    out.append("✓ Bulk sweep (parse_paces) agrees with parse_pace")
+else:
+    out.append("✗ Bulk sweep (parse_paces) disagrees with parse_pace")
+out.append("")
+
+out.append("Test 2: Expected K200s Workout Structure")
+out.append(_DASH)
+out.append("")
+
+# Workout parts as parallel columns; only pace and effort drive the
+# target computation, so that pass reads just those two
+names = ["Warm-up", "Strides", "Rest", "Main 1km", "Main 200m", "Recovery", "Cool-down"]
+distances = ["3km", "3x15s", "90s", "1km", "200m", "120s", "2.2km"]
+paces = [None, None, None, 4*60+50, 4*60+20, 4*60+50, None]
+efforts = ["easy", "fast", "recovery", "threshold", "interval", "recovery", "easy"]
+
+# Build every row's target text first, then emit rows from strings only
+targets = [pace_target_text(pace_sec, effort) for pace_sec, effort in zip(paces, efforts)]
+
+# One f-string per row
+out.extend(f"{name:15} {distance:8}{target}" for name, distance, target in zip(names, distances, targets))
+
+out.append("")
+out.append(_BAR)
+out.append("Expected intervals.icu Output Format:")
+out.append(_BAR)
+out.append("")
+out.append("Main Set 4x")
+out.append("  * 1km at 4:50/km Pace")
+out.append("  * 0.2km at 4:20/km Pace")
+out.append("  * 120s Z1 6:50-8:23/km (for 0.26km)")
+out.append("")
+out.append("Cool-down:")
+out.append("  * 2.2km Z1-Z3 5:20-8:23/km")
+out.append("")
+out.append(_BAR)
+out.append("✓ Test Complete!")
+out.append(_BAR)
+
+sys.stdout.write("\n".join(out))
+sys.stdout.write("\n")